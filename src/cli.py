@@ -13,6 +13,7 @@ Command groups:
 """
 
 import argparse
+import functools
 import logging
 import subprocess
 import sys
@@ -31,6 +32,15 @@ def _systemctl(*args: str) -> int:
     return subprocess.run(["systemctl", "--user", *args]).returncode
 
 
+@functools.lru_cache(maxsize=1)
+def _libraries_listing() -> str:
+    """The sorted library table, built once — it appears in the help epilog
+    and again in the unknown-library error."""
+    from config import LIBRARIES
+
+    return "\n".join(f"  {kid:>3}: {name}" for kid, name in sorted(LIBRARIES.items()))
+
+
 def _close_db() -> None:
     """Close the connection pool before exiting.
 
@@ -72,17 +82,16 @@ def cmd_book(args: argparse.Namespace) -> int:
     """Book a seat right now, straight from the terminal (no saved job)."""
     from config import LIBRARIES
     from core import db
-    from core.booking import execute_booking
+    from core.booking import execute_booking, format_target_date
     from core.exceptions import BookingError
 
     if args.date_offset is not None:
-        args.date = (date.today() + timedelta(days=args.date_offset)).strftime("%d.%m.%Y")
+        args.date = format_target_date(date.today() + timedelta(days=args.date_offset))
 
     if args.library not in LIBRARIES:
         print(f"ERROR: Unknown library ID {args.library}.", file=sys.stderr)
         print("Available libraries:", file=sys.stderr)
-        for kid, name in sorted(LIBRARIES.items()):
-            print(f"  {kid}: {name}", file=sys.stderr)
+        print(_libraries_listing(), file=sys.stderr)
         return 1
 
     db.init_db()
@@ -263,13 +272,10 @@ def main() -> int:
     sub = parser.add_subparsers(dest="command", required=True)
 
     # book: ad-hoc one-off booking
-    from config import LIBRARIES
     p_book = sub.add_parser(
         "book", help="Book a seat now from the terminal",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="Libraries:\n" + "\n".join(
-            f"  {kid:>3}: {name}" for kid, name in sorted(LIBRARIES.items())
-        ),
+        epilog="Libraries:\n" + _libraries_listing(),
     )
     p_book.add_argument("--library", type=int, default=1,
                         help="Library ID (default: 1 = Zentralbibliothek)")
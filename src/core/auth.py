@@ -17,6 +17,13 @@ from core.exceptions import BookingError
 
 log = logging.getLogger(__name__)
 
+# Patterns for picking form pieces out of the reservation pages, compiled once
+# — handle_captcha re-scans them on every retry.
+_CAPTCHA_IMG_RE = re.compile(r"data:image/jpeg;base64,([^'\"]+)")
+_TOKEN_RE = re.compile(r'name="sform_token"\s+value="([^"]+)"')
+_START_LINK_RE = re.compile(r'href="([^"]*)"[^>]*>Neue Platzreservierung starten')
+_WEITER_RE = re.compile(r'href="([^"]*)"[^>]*class="[^"]*ym-success[^"]*"')
+
 # Cache the SSO session cookies between runs so back-to-back bookings (each a
 # fresh process) reuse one login instead of re-authenticating every time. There
 # is no token expiry to check — a stale session just fails the logged-in check
@@ -88,12 +95,27 @@ def login(session: requests.Session, account) -> str:
             return resp.text
         log.info("  Cached session no longer valid, logging in fresh.")
         session.cookies.clear()
-    else:
-        # GET login page to establish cookies
+
+    # POST the credentials straight away — the SSO endpoint sets its cookies
+    # on the POST response too, which saves the cookie-priming GET (one full
+    # round trip on every fresh login).
+    resp = _post_credentials(session, account)
+    if _LOGGED_IN_MARKER not in resp.text:
+        # Either bad credentials or a server state that insists on the priming
+        # GET; retry once the long way before blaming the credentials.
+        log.info("  Direct login POST not accepted, retrying with priming GET.")
+        session.cookies.clear()
         session.get(BASE_URL)
+        resp = _post_credentials(session, account)
+    if _LOGGED_IN_MARKER not in resp.text:
+        raise BookingError(f"Login failed for {account.sso_username}. Check credentials.")
+    _save_cookies(session, account)
+    log.info("  Logged in successfully.")
+    return resp.text
+
 
-    # POST credentials
-    resp = session.post(
+def _post_credentials(session: requests.Session, account) -> requests.Response:
+    return session.post(
         BASE_URL,
         data={
             "httpd_username": account.sso_username,
@@ -102,11 +124,6 @@ def login(session: requests.Session, account) -> str:
         },
         allow_redirects=True,
     )
-    if _LOGGED_IN_MARKER not in resp.text:
-        raise BookingError(f"Login failed for {account.sso_username}. Check credentials.")
-    _save_cookies(session, account)
-    log.info("  Logged in successfully.")
-    return resp.text
 
 
 def handle_captcha(session: requests.Session, html: str, library_number: str) -> None:
@@ -115,11 +132,11 @@ def handle_captcha(session: requests.Session, html: str, library_number: str) ->
 
     for attempt in range(1, MAX_CAPTCHA_RETRIES + 1):
         # Extract captcha image (base64 inline JPEG)
-        m = re.search(r"data:image/jpeg;base64,([^'\"]+)", html)
+        m = _CAPTCHA_IMG_RE.search(html)
         if not m:
             # No captcha on page — already registered, just need to start a new reservation
             if "Neue Platzreservierung starten" in html:
-                start_link = re.search(r'href="([^"]*)"[^>]*>Neue Platzreservierung starten', html)
+                start_link = _START_LINK_RE.search(html)
                 if start_link:
                     log.info("  Already registered, starting new reservation...")
                     new_resp = session.get(urljoin(BASE_URL, start_link.group(1)))
@@ -143,9 +160,7 @@ def handle_captcha(session: requests.Session, html: str, library_number: str) ->
             continue
 
         # Extract form token
-        token_match = re.search(
-            r'name="sform_token"\s+value="([^"]+)"', html
-        )
+        token_match = _TOKEN_RE.search(html)
         if not token_match:
             raise BookingError("Could not find sform_token.")
 
@@ -165,7 +180,7 @@ def handle_captcha(session: requests.Session, html: str, library_number: str) ->
         if "Erfolg" in resp.text:
             log.info("  Captcha solved successfully!")
             # Follow the "Weiter" link if present
-            weiter = re.search(r'href="([^"]*)"[^>]*class="[^"]*ym-success[^"]*"', resp.text)
+            weiter = _WEITER_RE.search(resp.text)
             if weiter:
                 session.get(urljoin(BASE_URL, weiter.group(1)))
             return
@@ -181,7 +196,7 @@ def handle_captcha(session: requests.Session, html: str, library_number: str) ->
             continue
 
         if "Neue Platzreservierung starten" in resp.text:
-            start_link = re.search(r'href="([^"]*)"[^>]*>Neue Platzreservierung starten', resp.text)
+            start_link = _START_LINK_RE.search(resp.text)
             if start_link:
                 log.info("  Already registered, starting new reservation...")
                 new_resp = session.get(urljoin(BASE_URL, start_link.group(1)))
@@ -1,8 +1,10 @@
 """Shared booking orchestrator — used by both CLI and web."""
 
 import logging
+import threading
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from core.auth import login, handle_captcha
 from core.reservation import find_timeslot, select_seat, reserve_seat
@@ -10,6 +12,51 @@ from core.reservation import find_timeslot, select_seat, reserve_seat
 log = logging.getLogger(__name__)
 
 
+def format_target_date(d) -> str:
+    """Format a date as DD.MM.YYYY, the form the reservation site expects.
+
+    A plain f-string — the format is fixed, so strftime's format-string
+    machinery buys nothing here.
+    """
+    return f"{d.day:02d}.{d.month:02d}.{d.year:04d}"
+
+
+def _make_session() -> requests.Session:
+    """A Session tuned for the booking flow: 6+ sequential requests to one host.
+
+    The explicit adapter keeps the TLS connection alive across all steps so only
+    the first request pays the handshake; pool_maxsize leaves headroom for the
+    redirects the SSO flow chains.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": "Mozilla/5.0", "Connection": "keep-alive"})
+    return session
+
+
+# One Session per account for the lifetime of the process. Timer-fired workers
+# are one-shot and never hit this twice, but the web app's "run now" path does:
+# reusing the Session keeps the TLS connection and in-memory cookies warm, and
+# login() revalidates cheaply on every booking, so a stale entry just means one
+# fresh credential POST on an already-open connection. Per account, because
+# sessions carry that account's SSO cookies. Each Session comes with a lock
+# that execute_booking holds for the whole flow: two overlapping bookings on
+# one cookie jar would interleave login()'s cookie clear and the captcha form
+# exchange and corrupt both, so same-account bookings run one at a time.
+_sessions: dict[int, tuple[requests.Session, threading.Lock]] = {}
+_sessions_lock = threading.Lock()
+
+
+def _session_for(account) -> tuple[requests.Session, threading.Lock]:
+    with _sessions_lock:
+        entry = _sessions.get(account.id)
+        if entry is None:
+            entry = _sessions[account.id] = (_make_session(), threading.Lock())
+        return entry
+
+
 def execute_booking(account, library_id: int, date: str, time_slot: str,
                     group_room: bool = False, preferred_section: str = "") -> dict:
     """Run a full booking flow for one ULB account (a ``db.Account``).
@@ -18,20 +65,21 @@ def execute_booking(account, library_id: int, date: str, time_slot: str,
     preferences, edited on the dashboard's settings page.
 
     Returns {"success": True, "seat_desc": "...", "message": "..."} on success.
-    Raises BookingError on failure.
+    Raises BookingError on failure. Bookings for the same account are
+    serialized — they share one Session and cookie jar.
     """
-    session = requests.Session()
-    session.headers.update({"User-Agent": "Mozilla/5.0"})
+    session, lock = _session_for(account)
 
-    html = login(session, account)
-    handle_captcha(session, html, account.library_number)
+    with lock:
+        html = login(session, account)
+        handle_captcha(session, html, account.library_number)
 
-    timeslot_href = find_timeslot(session, library_id, date, time_slot,
-                                  group_room=group_room, preferred_section=preferred_section)
-    preferred = account.preferred_group_rooms if group_room else account.preferred_seats
-    seat_href, seat_desc = select_seat(session, timeslot_href, group_room=group_room,
-                                       preferred=preferred or [])
-    details = reserve_seat(session, seat_href)
+        timeslot_href = find_timeslot(session, library_id, date, time_slot,
+                                      group_room=group_room, preferred_section=preferred_section)
+        preferred = account.preferred_group_rooms if group_room else account.preferred_seats
+        seat_href, seat_desc = select_seat(session, timeslot_href, group_room=group_room,
+                                           preferred=preferred or [])
+        details = reserve_seat(session, seat_href)
     return {
         "success": True,
         "seat_desc": seat_desc,
@@ -2,11 +2,9 @@
 
 import io
 import os
+import threading
 from collections import Counter
 
-from PIL import Image
-import pytesseract
-
 # No sudo on this host, so the tessdata language files live under the user's
 # home dir instead of /usr/share/tessdata. Set this unconditionally (rather
 # than relying on a TESSDATA_PREFIX env var being exported by whatever
@@ -18,25 +16,71 @@ os.environ.setdefault("TESSDATA_PREFIX", _TESSDATA_DIR)
 
 CAPTCHA_LENGTH = 6
 
+_CHAR_WHITELIST = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+
 # (upscale factor, binarization threshold) combinations that are OCRed
 # independently; the majority answer wins. Upscaling helps tesseract with the
 # small captcha font, but no single threshold cleanly separates the text from
 # the colored noise lines on every image, so we vote across several.
 _VARIANTS = [(3, 180), (3, 160), (1, 160), (1, 200), (4, 160)]
 
+# Threshold lookup tables, built once per distinct threshold: point() with a
+# Python lambda rebuilds its table through 256 interpreter calls on every
+# variant of every captcha.
+_THRESHOLD_LUTS = {
+    threshold: [255 if p > threshold else 0 for p in range(256)]
+    for _, threshold in _VARIANTS
+}
+
+
+# In-process tesseract via tesserocr, created on first use: pytesseract forks
+# a fresh tesseract binary per call, which at five variants per captcha is five
+# spawn+model-init cycles on the booking critical path. tesserocr is optional —
+# it needs the libtesseract headers to build — so fall back to pytesseract
+# when it is not installed. False means "tried and unavailable".
+_TESSER_API = None
+_TESSER_LOCK = threading.Lock()  # the API object is not thread-safe
+
+
+def _get_tesser_api():
+    global _TESSER_API
+    if _TESSER_API is None:
+        try:
+            from tesserocr import PSM, PyTessBaseAPI
+
+            api = PyTessBaseAPI(path=_TESSDATA_DIR, psm=PSM.SINGLE_LINE)
+            api.SetVariable("tessedit_char_whitelist", _CHAR_WHITELIST)
+            _TESSER_API = api
+        except ImportError:
+            _TESSER_API = False
+    return _TESSER_API or None
+
+
+def _ocr_variant(img: "Image.Image", scale: int, threshold: int) -> str:
+    # Imported lazily (with PIL below) so processes that never solve a captcha
+    # — notably the web UI between bookings — skip loading the C extensions.
+    from PIL import Image
 
-def _ocr_variant(img: Image.Image, scale: int, threshold: int) -> str:
     gray = img.convert("L")
     if scale != 1:
         gray = gray.resize((gray.width * scale, gray.height * scale), Image.LANCZOS)
     # Threshold to isolate white text from dark bg + colored lines
-    binary = gray.point(lambda p: 255 if p > threshold else 0)
+    binary = gray.point(_THRESHOLD_LUTS[threshold])
+
+    api = _get_tesser_api()
+    if api is not None:
+        with _TESSER_LOCK:
+            api.SetImage(binary)
+            return api.GetUTF8Text().strip()
+
+    import pytesseract
+
     return pytesseract.image_to_string(
         binary,
         config=(
             "--psm 7 --tessdata-dir "
             f"{_TESSDATA_DIR} "
-            "-c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+            f"-c tessedit_char_whitelist={_CHAR_WHITELIST}"
         ),
     ).strip()
 
@@ -48,6 +92,8 @@ def solve_captcha(image_bytes: bytes) -> str:
     length, so callers can re-fetch a fresh captcha instead of submitting
     something that is certainly wrong.
     """
+    from PIL import Image
+
     img = Image.open(io.BytesIO(image_bytes))
     results = [_ocr_variant(img, scale, threshold) for scale, threshold in _VARIANTS]
     valid = [r for r in results if len(r) == CAPTCHA_LENGTH]
@@ -273,6 +273,16 @@ def init_db() -> None:
                 manual          BOOLEAN NOT NULL DEFAULT FALSE
             )
         """)
+        # Match the list queries: /jobs orders an account's jobs by
+        # created_at DESC, history orders its log rows by started_at DESC.
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS ix_jobs_account_created
+                ON ulb_jobs (account_id, created_at DESC)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS ix_booking_log_account_started
+                ON ulb_booking_log (account_id, started_at DESC)
+        """)
 
 
 # ── Users ────────────────────────────────────────────────────────────────────
@@ -667,34 +677,36 @@ def get_all_invites() -> list[Invite]:
 
 # ── Jobs CRUD ────────────────────────────────────────────────────────────────
 
-def create_job(account_id: int, data: dict) -> int:
+def create_job(account_id: int, data: dict) -> Job:
+    """Insert a job and return the full row (single round trip)."""
     with _pool.connection() as conn:
-        row = conn.execute(
-            """INSERT INTO ulb_jobs
-               (account_id, name, library_id, time_slot, group_room, preferred_section,
-                recurring, cron_days, date_offset, cron_hour, cron_minute,
-                run_at, target_date, enabled, created_at)
-               VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-               RETURNING id""",
-            (
-                account_id,
-                data["name"],
-                data["library_id"],
-                data["time_slot"],
-                bool(data.get("group_room", False)),
-                data.get("preferred_section"),
-                bool(data.get("recurring", False)),
-                data.get("cron_days"),
-                data.get("date_offset"),
-                data.get("cron_hour"),
-                data.get("cron_minute"),
-                data.get("run_at"),
-                data.get("target_date"),
-                bool(data.get("enabled", True)),
-                _now(),
-            ),
-        ).fetchone()
-    return row["id"]
+        with conn.cursor(row_factory=class_row(Job)) as cur:
+            cur.execute(
+                """INSERT INTO ulb_jobs
+                   (account_id, name, library_id, time_slot, group_room, preferred_section,
+                    recurring, cron_days, date_offset, cron_hour, cron_minute,
+                    run_at, target_date, enabled, created_at)
+                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                   RETURNING *""",
+                (
+                    account_id,
+                    data["name"],
+                    data["library_id"],
+                    data["time_slot"],
+                    bool(data.get("group_room", False)),
+                    data.get("preferred_section"),
+                    bool(data.get("recurring", False)),
+                    data.get("cron_days"),
+                    data.get("date_offset"),
+                    data.get("cron_hour"),
+                    data.get("cron_minute"),
+                    data.get("run_at"),
+                    data.get("target_date"),
+                    bool(data.get("enabled", True)),
+                    _now(),
+                ),
+            )
+            return cur.fetchone()
 
 
 def get_job(job_id: int, account_id: int | None = None) -> Job | None:
@@ -731,32 +743,36 @@ def get_enabled_jobs(account_id: int | None = None) -> list[Job]:
             return cur.fetchall()
 
 
-def update_job(job_id: int, data: dict) -> None:
+def update_job(job_id: int, data: dict) -> Job | None:
+    """Update a job and return the new row (single round trip)."""
     with _pool.connection() as conn:
-        conn.execute(
-            """UPDATE ulb_jobs SET
-               name=%s, library_id=%s, time_slot=%s, group_room=%s,
-               preferred_section=%s, recurring=%s,
-               cron_days=%s, date_offset=%s, cron_hour=%s, cron_minute=%s,
-               run_at=%s, target_date=%s, enabled=%s
-               WHERE id=%s""",
-            (
-                data["name"],
-                data["library_id"],
-                data["time_slot"],
-                bool(data.get("group_room", False)),
-                data.get("preferred_section"),
-                bool(data.get("recurring", False)),
-                data.get("cron_days"),
-                data.get("date_offset"),
-                data.get("cron_hour"),
-                data.get("cron_minute"),
-                data.get("run_at"),
-                data.get("target_date"),
-                bool(data.get("enabled", True)),
-                job_id,
-            ),
-        )
+        with conn.cursor(row_factory=class_row(Job)) as cur:
+            cur.execute(
+                """UPDATE ulb_jobs SET
+                   name=%s, library_id=%s, time_slot=%s, group_room=%s,
+                   preferred_section=%s, recurring=%s,
+                   cron_days=%s, date_offset=%s, cron_hour=%s, cron_minute=%s,
+                   run_at=%s, target_date=%s, enabled=%s
+                   WHERE id=%s
+                   RETURNING *""",
+                (
+                    data["name"],
+                    data["library_id"],
+                    data["time_slot"],
+                    bool(data.get("group_room", False)),
+                    data.get("preferred_section"),
+                    bool(data.get("recurring", False)),
+                    data.get("cron_days"),
+                    data.get("date_offset"),
+                    data.get("cron_hour"),
+                    data.get("cron_minute"),
+                    data.get("run_at"),
+                    data.get("target_date"),
+                    bool(data.get("enabled", True)),
+                    job_id,
+                ),
+            )
+            return cur.fetchone()
 
 
 def delete_job(job_id: int) -> None:
@@ -764,14 +780,25 @@ def delete_job(job_id: int) -> None:
         conn.execute("DELETE FROM ulb_jobs WHERE id = %s", (job_id,))
 
 
-def toggle_job(job_id: int) -> bool:
-    """Toggle enabled state. Returns new state."""
+def toggle_job(job_id: int, account_id: int | None = None) -> Job | None:
+    """Toggle enabled state and return the new row (single round trip).
+
+    Pass ``account_id`` to scope the flip to one account's jobs.
+    """
     with _pool.connection() as conn:
-        row = conn.execute(
-            "UPDATE ulb_jobs SET enabled = NOT enabled WHERE id = %s RETURNING enabled",
-            (job_id,),
-        ).fetchone()
-    return row["enabled"] if row else False
+        with conn.cursor(row_factory=class_row(Job)) as cur:
+            if account_id is None:
+                cur.execute(
+                    "UPDATE ulb_jobs SET enabled = NOT enabled WHERE id = %s RETURNING *",
+                    (job_id,),
+                )
+            else:
+                cur.execute(
+                    """UPDATE ulb_jobs SET enabled = NOT enabled
+                       WHERE id = %s AND account_id = %s RETURNING *""",
+                    (job_id, account_id),
+                )
+            return cur.fetchone()
 
 
 def disable_job(job_id: int) -> None:
@@ -807,6 +834,18 @@ def log_booking_finish(log_id: int, status: str, seat_desc: str = None,
         )
 
 
+def get_booking(log_id: int, account_id: int | None = None) -> Booking | None:
+    """Fetch one booking-log row. Pass ``account_id`` to scope it to an account."""
+    with _pool.connection() as conn:
+        with conn.cursor(row_factory=class_row(Booking)) as cur:
+            if account_id is None:
+                cur.execute("SELECT * FROM ulb_booking_log WHERE id = %s", (log_id,))
+            else:
+                cur.execute("SELECT * FROM ulb_booking_log WHERE id = %s AND account_id = %s",
+                            (log_id, account_id))
+            return cur.fetchone()
+
+
 def get_recent_bookings(account_id: int | None = None, limit: int = 50) -> list[Booking]:
     with _pool.connection() as conn:
         with conn.cursor(row_factory=class_row(Booking)) as cur:
@@ -4,16 +4,31 @@ import logging
 import re
 from collections.abc import Sequence
 from datetime import datetime
-from urllib.parse import parse_qs, urljoin, urlparse
+from html import unescape
+from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
 
 from config import BASE_URL
 from core.exceptions import BookingError
 
 log = logging.getLogger(__name__)
 
+# Compiled once — these run per table row / seat link on every booking.
+_TIME_RANGE_RE = re.compile(r"(\d{2}:\d{2})\u2013(\d{2}:\d{2})")
+_FREE_COUNT_RE = re.compile(r"(\d+)")
+_SEAT_NUM_RE = re.compile(r"(?:Platz|Kabine|Raum)\s+(\d+)")
+# The hrefs carry exactly one id each — pull it straight out instead of
+# building a full parse_qs dict per link.
+_SLOT_ID_RE = re.compile(r"[?&]reservationtimeslot_id=(\d+)")
+_ALREADY_RESERVED_RE = re.compile(r"bereits", re.IGNORECASE)
+# One pass over the raw HTML replaces the DOM build in select_seat: captures
+# (href, seat_id, link text, trailing text). The [?&;] guard matches raw and
+# &amp;-escaped query separators.
+_SEAT_LINK_RE = re.compile(
+    r'<a[^>]+href="([^"]*[?&;]seat_id=(\d+)[^"]*)"[^>]*>([^<]*)</a>([^<]*)'
+)
+
 
 def find_timeslot(
     session: requests.Session, library_id: int, target_date: str, target_time: str,
@@ -27,41 +42,50 @@ def find_timeslot(
     slot_type = "group room" if group_room else "seat"
     log.info("[3/6] Looking for %s time slot: %s %s at library %d...", slot_type, target_date, target_time, library_id)
 
+    from bs4 import BeautifulSoup
+
     url = f"{BASE_URL}?mod=190&library_id={library_id}"
     resp = session.get(url)
-    soup = BeautifulSoup(resp.text, "html.parser")
+    soup = BeautifulSoup(resp.text, "lxml")
 
     date_ddmmyyyy = target_date
     log.info("  Looking for date %s and time %s...", date_ddmmyyyy, target_time)
     start_time, end_time = target_time.split("-")
     target_pattern = f"{start_time}\u2013{end_time}"  # en-dash
 
-    # Collect all slots for the target date
+    # Collect all slots for the target date. Headings and rows come back in
+    # document order, so one forward pass tracking the current <h2> section
+    # replaces a find_previous("h2") tree walk per slot link.
     available_slots = []  # (slot_time, slot_id, section, href) — all date matches
     matching_slots = []   # same tuple — date AND time matches
-    for link in soup.find_all("a", href=True):
-        href = link["href"]
-        if "reservationtimeslot_id=" not in href:
+    section = ""
+    section_is_group = False
+    for el in soup.find_all(["h2", "tr"]):
+        if el.name == "h2":
+            section = el.get_text().strip()
+            # Case-fold once per heading, not once per row below it
+            section_is_group = "gruppen" in section.casefold()
             continue
 
-        row = link.find_parent("tr")
-        if not row:
+        row = el
+        link = row.select_one('a[href*="reservationtimeslot_id="]')
+        if link is None:
             continue
+        href = link["href"]
 
         row_text = row.get_text()
 
         if date_ddmmyyyy not in row_text:
             continue
 
-        time_match = re.search(r"(\d{2}:\d{2})\u2013(\d{2}:\d{2})", row_text)
-        qs = parse_qs(urlparse(href).query)
-        slot_id = int(qs["reservationtimeslot_id"][0])
+        time_match = _TIME_RANGE_RE.search(row_text)
+        id_match = _SLOT_ID_RE.search(href)
+        if not id_match:
+            continue
+        slot_id = int(id_match.group(1))
 
         # Filter by section type (group room vs individual)
-        section_h2 = row.find_previous("h2")
-        section = section_h2.get_text().strip() if section_h2 else ""
-        is_group_section = "Gruppen".lower() in section.lower()
-        if group_room != is_group_section:
+        if group_room != section_is_group:
             continue
 
         if time_match:
@@ -69,7 +93,8 @@ def find_timeslot(
             available_slots.append((slot_time, slot_id, section, href))
 
         if target_pattern in row_text:
-            free_match = re.search(r"(\d+)", row.find_all("td")[1].get_text()) if len(row.find_all("td")) > 1 else None
+            tds = row.find_all("td")
+            free_match = _FREE_COUNT_RE.search(tds[1].get_text()) if len(tds) > 1 else None
             free_count = free_match.group(1) if free_match else "?"
             matching_slots.append((slot_id, section, href, free_count))
 
@@ -113,43 +138,50 @@ def select_seat(session: requests.Session, timeslot_href: str, group_room: bool
     if "Reservierung möglich?" in resp.text and "Nein" in resp.text:
         raise BookingError("Reservation not possible for this time slot.")
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    # The seat list is flat enough that one regex pass over the raw HTML
+    # replaces building a DOM just to walk the anchors.
     seat_links = []
-    for link in soup.find_all("a", href=True):
-        href = link["href"]
-        if "seat_id=" in href:
-            qs = parse_qs(urlparse(href).query)
-            seat_id = int(qs["seat_id"][0])
-            desc = link.get_text().strip()
-            # Get extra info from the text after the link
-            next_text = link.next_sibling
-            if next_text and isinstance(next_text, str):
-                desc += " " + next_text.strip().strip("()")
-            seat_links.append((href, seat_id, desc))
+    for m in _SEAT_LINK_RE.finditer(resp.text):
+        href = unescape(m.group(1))
+        seat_id = int(m.group(2))
+        desc = m.group(3).strip()
+        # Extra info from the text after the link
+        tail = m.group(4).strip().strip("()")
+        if tail:
+            desc = f"{desc} {tail}" if desc else tail
+        seat_links.append((href, seat_id, unescape(desc)))
 
     if not seat_links:
         raise BookingError(f"No available {slot_type} found.")
 
     log.info("  %d %s available.", len(seat_links), slot_type)
 
-    # Try preferred seats/rooms first (match by number in description)
-    preferred_list = list(preferred)
-    seat_by_number = {}
-    for href, sid, desc in seat_links:
-        m = re.search(r"(?:Platz|Kabine|Raum)\s+(\d+)", desc)
-        if m:
-            seat_by_number[int(m.group(1))] = (href, sid, desc)
-
-    for number in preferred_list:
-        if number in seat_by_number:
-            seat_href, seat_id, desc = seat_by_number[number]
-            log.info("  Selected preferred %s: %s (ID=%d)", slot_type.rstrip('s'), desc, seat_id)
-            return seat_href, desc
+    # Try preferred seats/rooms first (match by number in description). One
+    # pass ranked by preference order — it exits as soon as the top choice
+    # turns up instead of indexing every seat and probing the list afterwards.
+    pref_rank = {number: i for i, number in enumerate(preferred)}
+    best = None  # (rank, href, seat_id, desc)
+    if pref_rank:
+        for href, sid, desc in seat_links:
+            m = _SEAT_NUM_RE.search(desc)
+            if not m:
+                continue
+            rank = pref_rank.get(int(m.group(1)))
+            if rank is None or (best is not None and rank > best[0]):
+                continue
+            best = (rank, href, sid, desc)
+            if rank == 0:
+                break
+
+    if best is not None:
+        _, seat_href, seat_id, desc = best
+        log.info("  Selected preferred %s: %s (ID=%d)", slot_type.rstrip('s'), desc, seat_id)
+        return seat_href, desc
 
     # Fallback to first available
     seat_href, seat_id, desc = seat_links[0]
-    if preferred_list:
-        log.info("  Preferred %s not available, falling back to: %s (ID=%d)", preferred_list, desc, seat_id)
+    if pref_rank:
+        log.info("  Preferred %s not available, falling back to: %s (ID=%d)", list(preferred), desc, seat_id)
     else:
         log.info("  Selected: %s (ID=%d)", desc, seat_id)
     return seat_href, desc
@@ -163,25 +195,31 @@ def reserve_seat(session: requests.Session, seat_href: str) -> str:
     resp = session.get(url)
 
     if "Erfolg" in resp.text:
+        from bs4 import BeautifulSoup
+
         log.info("  Reservation successful!")
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(resp.text, "lxml")
         details = []
-        for tr in soup.find_all("tr", style=lambda s: s and "yellow" in s):
+        # Only the first highlighted row matters — stop at the first hit
+        # instead of collecting every match and breaking.
+        tr = soup.select_one('tr[style*="yellow"]')
+        if tr is not None:
             td = tr.find_all("td")
             if len(td) >= 2:
-                lines = [l.strip() for l in td[1].get_text(separator="\n").split("\n") if l.strip()]
-                for line in lines:
+                # stripped_strings yields the non-empty, pre-stripped text
+                # nodes directly — no joined string to build and resplit
+                for line in td[1].stripped_strings:
                     if line in ("Platz-Umtausch versuchen", "Reservierung jetzt stornieren"):
                         continue
                     if "Platz-Umtausch möglich" in line or "Stornierung möglich" in line:
                         continue
                     details.append(line)
-            break
         detail_str = "; ".join(details)
         log.info("[6/6] Reservation details: %s", detail_str)
         return detail_str
 
     msg = "Reservation failed."
-    if "bereits" in resp.text.lower():
+    # Case-insensitive regex instead of .lower(), which copies the whole body
+    if _ALREADY_RESERVED_RE.search(resp.text):
         msg += " You may already have a reservation for this time."
     raise BookingError(msg)
@@ -17,6 +17,7 @@ source of truth and systemd is just a projection of it.
 import logging
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from config import PORT
@@ -56,10 +57,14 @@ def _timer_name(job_id: int) -> str:
     return f"ulb-book@{job_id}.timer"
 
 
-def _target_days_to_trigger_days(target_days: str, date_offset: int) -> list[str]:
+@lru_cache(maxsize=256)
+def _target_days_to_trigger_days(target_days: str, date_offset: int) -> tuple[str, ...]:
     """Days the user wants a seat → days the timer should fire (subtract offset).
 
     Example: target "mon", offset 3 → fire on "fri" (book 3 days ahead).
+
+    Pure over its arguments, and sync_all_jobs recomputes it for every job on
+    each install/sync — cached so repeated schedules become a dict hit.
     """
     trigger = []
     for day in target_days.split(","):
@@ -67,7 +72,7 @@ def _target_days_to_trigger_days(target_days: str, date_offset: int) -> list[str
         if day not in DAY_INDEX:
             continue
         trigger.append(DAY_NAMES[(DAY_INDEX[day] - date_offset) % 7])
-    return trigger or ["mon", "tue", "wed", "thu", "fri"]
+    return tuple(trigger) or ("mon", "tue", "wed", "thu", "fri")
 
 
 def _on_calendar(job: db.Job) -> str | None:
@@ -0,0 +1,41 @@
+"""Optional warm-up for a resident process (the web UI).
+
+The first OCR call pays the tesseract spawn and language-model load, and the
+first request to the ULB host pays DNS resolution; neither belongs inside a
+user's "run now" click. Gated behind ``ULB_WARMUP=1`` — the one-shot timer
+workers gain nothing from warming a process that exits after one booking.
+"""
+
+import io
+import logging
+import os
+
+log = logging.getLogger(__name__)
+
+
+def warmup() -> None:
+    """Exercise OCR and the ULB host once so the first real booking is fast."""
+    if os.environ.get("ULB_WARMUP") != "1":
+        return
+
+    try:
+        from PIL import Image
+
+        from core.captcha import solve_captcha
+
+        buf = io.BytesIO()
+        Image.new("L", (90, 30), 0).save(buf, format="JPEG")
+        solve_captcha(buf.getvalue())
+        log.info("OCR warmed up.")
+    except Exception as exc:
+        log.warning("OCR warm-up failed: %s", exc)
+
+    try:
+        import requests
+
+        from config import BASE_URL
+
+        requests.get(BASE_URL, timeout=10)
+        log.info("ULB host warmed up.")
+    except Exception as exc:
+        log.warning("ULB warm-up request failed: %s", exc)
@@ -9,7 +9,7 @@ import logging
 from datetime import date, timedelta
 
 from core import db
-from core.booking import execute_booking
+from core.booking import execute_booking, format_target_date
 from core.exceptions import BookingError
 
 log = logging.getLogger(__name__)
@@ -52,7 +52,7 @@ def run_job(job_id: int) -> None:
         result = execute_booking(
             account=account,
             library_id=job.library_id,
-            date=target_date.strftime("%d.%m.%Y"),
+            date=format_target_date(target_date),
             time_slot=job.time_slot,
             group_room=job.group_room,
             preferred_section=job.preferred_section or "",
@@ -15,6 +15,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 
 from core import db
+from core.warmup import warmup
 from web.routes import router
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
@@ -38,6 +39,7 @@ async def _idle_watchdog(app: FastAPI) -> None:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     db.init_db()
+    warmup()
     app.state.last_request = time.monotonic()
     watchdog = asyncio.create_task(_idle_watchdog(app)) if IDLE_TIMEOUT > 0 else None
     yield
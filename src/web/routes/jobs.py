@@ -1,16 +1,18 @@
 """Jobs routes: /jobs/*"""
 
 import logging
+import re
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from html import escape
 from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, Depends, Form, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, Form, Request
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 
 from core import db
 from core import systemd
-from core.booking import execute_booking
+from core.booking import execute_booking, format_target_date
 from core.exceptions import BookingError
 from web import templates, ctx
 from web.auth import Auth, require_account
@@ -21,25 +23,55 @@ router = APIRouter()
 
 _TZ = ZoneInfo("Europe/Berlin")
 
+# Template objects resolved once at import — TemplateResponse re-resolves the
+# name through the Jinja environment on every request otherwise.
+_JOBS_TPL = templates.get_template("jobs.html")
+_JOB_FORM_TPL = templates.get_template("job_form.html")
+_JOB_ROW_TPL = templates.get_template("partials/job_row.html")
+
 
 @router.get("/jobs", response_class=HTMLResponse)
 def job_list(request: Request, auth: Auth = Depends(require_account)):
     jobs = db.get_all_jobs(auth.account.id)
-    return templates.TemplateResponse("jobs.html", ctx(request, auth=auth, jobs=jobs))
+    # Stream the render so the first bytes go out while later rows are still
+    # being formatted — time-to-first-byte stays flat as the job list grows.
+    return StreamingResponse(_JOBS_TPL.generate(ctx(request, auth=auth, jobs=jobs)),
+                             media_type="text/html")
 
 
 @router.get("/jobs/new", response_class=HTMLResponse)
 def job_new(request: Request, auth: Auth = Depends(require_account)):
-    return templates.TemplateResponse("job_form.html", ctx(request, auth=auth, job=None))
+    return HTMLResponse(_JOB_FORM_TPL.render(ctx(request, auth=auth, job=None)))
+
+
+# Shape check compiled once; as lenient as "%d.%m.%Y" about unpadded day/month.
+_DATE_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})$")
+
+
+@lru_cache(maxsize=512)
+def _parse_ddmmyyyy(value: str) -> datetime | None:
+    """Cached DD.MM.YYYY parse; None for invalid input (cached as well).
+
+    The format is fixed, so match and convert directly — strptime would spin
+    up its whole format-string machinery for three integers. The regex settles
+    malformed input without raising; only calendar-impossible dates like
+    31.02. still take the ValueError path.
+    """
+    m = _DATE_RE.match(value)
+    if not m:
+        return None
+    try:
+        return datetime(int(m.group(3)), int(m.group(2)), int(m.group(1)))
+    except ValueError:
+        return None
 
 
 def _build_run_at(run_date: str, run_hour: int, run_minute: int) -> datetime | None:
     """Build an aware datetime from DD.MM.YYYY date string + hour/minute."""
     if not run_date:
         return None
-    try:
-        dt = datetime.strptime(run_date, "%d.%m.%Y")
-    except ValueError:
+    dt = _parse_ddmmyyyy(run_date)
+    if dt is None:
         return None
     return dt.replace(hour=run_hour, minute=run_minute, tzinfo=_TZ)
 
@@ -48,10 +80,8 @@ def _parse_date(value: str) -> date | None:
     """Parse a DD.MM.YYYY form value into a date."""
     if not value:
         return None
-    try:
-        return datetime.strptime(value, "%d.%m.%Y").date()
-    except ValueError:
-        return None
+    dt = _parse_ddmmyyyy(value)
+    return dt.date() if dt else None
 
 
 class JobForm:
@@ -94,8 +124,8 @@ class JobForm:
 @router.post("/jobs", response_class=HTMLResponse)
 def job_create(request: Request, form: JobForm = Depends(),
                auth: Auth = Depends(require_account)):
-    job_id = db.create_job(auth.account.id, {**form.data, "enabled": True})
-    systemd.sync_job_timer(db.get_job(job_id))
+    job = db.create_job(auth.account.id, {**form.data, "enabled": True})
+    systemd.sync_job_timer(job)
     return RedirectResponse(url="/jobs", status_code=303)
 
 
@@ -109,7 +139,12 @@ def job_edit(request: Request, job_id: int, auth: Auth = Depends(require_account
         job.run_date = job.run_at.strftime("%d.%m.%Y")
         job.run_hour = job.run_at.hour
         job.run_minute = job.run_at.minute
-    return templates.TemplateResponse("job_form.html", ctx(request, auth=auth, job=job))
+    return HTMLResponse(_JOB_FORM_TPL.render(ctx(request, auth=auth, job=job)))
+
+
+# The job fields that feed systemd.sync_job_timer ("enabled" is carried over
+# unchanged by job_update, so it cannot differ there).
+_SCHEDULE_FIELDS = ("recurring", "cron_days", "date_offset", "cron_hour", "cron_minute", "run_at")
 
 
 @router.post("/jobs/{job_id}", response_class=HTMLResponse)
@@ -118,8 +153,12 @@ def job_update(request: Request, job_id: int, form: JobForm = Depends(),
     existing = db.get_job(job_id, auth.account.id)
     if not existing:
         return RedirectResponse(url="/jobs", status_code=303)
-    db.update_job(job_id, {**form.data, "enabled": existing.enabled})
-    systemd.sync_job_timer(db.get_job(job_id))
+    job = db.update_job(job_id, {**form.data, "enabled": existing.enabled})
+    # Only rewrite the timer unit when the schedule itself changed — a rename
+    # or seat-preference edit should not cost a systemctl daemon-reload.
+    # (aware-datetime equality compares instants, so run_at is safe to diff.)
+    if any(getattr(existing, f) != form.data[f] for f in _SCHEDULE_FIELDS):
+        systemd.sync_job_timer(job)
     return RedirectResponse(url="/jobs", status_code=303)
 
 
@@ -135,20 +174,47 @@ def job_delete(request: Request, job_id: int, auth: Auth = Depends(require_accou
 
 @router.post("/jobs/{job_id}/toggle", response_class=HTMLResponse)
 def job_toggle(request: Request, job_id: int, auth: Auth = Depends(require_account)):
-    if not db.get_job(job_id, auth.account.id):
+    # One statement flips the flag and returns the fresh row — no read-before-
+    # write, no re-read afterwards.
+    job = db.toggle_job(job_id, auth.account.id)
+    if not job:
         return HTMLResponse("")
-    new_state = db.toggle_job(job_id)
-    job = db.get_job(job_id)
-    if job:
-        if new_state:
-            systemd.sync_job_timer(job)
-        else:
-            systemd.remove_job_timer(job_id)
-    return templates.TemplateResponse("partials/job_row.html", ctx(request, auth=auth, job=job))
+    if job.enabled:
+        systemd.sync_job_timer(job)
+    else:
+        systemd.remove_job_timer(job_id)
+    return HTMLResponse(_JOB_ROW_TPL.render(ctx(request, auth=auth, job=job)))
+
+
+def _pending_alert(log_id: int) -> str:
+    return (
+        f'<div role="alert" aria-busy="true" hx-get="/jobs/runs/{log_id}" '
+        'hx-trigger="every 1s" hx-swap="outerHTML">Booking…</div>'
+    )
+
+
+def _run_booking(account, job: db.Job, target_date: date, log_id: int) -> None:
+    """The actual booking for a manual run, executed off the request path."""
+    try:
+        result = execute_booking(
+            account=account,
+            library_id=job.library_id,
+            date=format_target_date(target_date),
+            time_slot=job.time_slot,
+            group_room=job.group_room,
+            preferred_section=job.preferred_section or "",
+        )
+        db.log_booking_finish(log_id, "success", result.get("seat_desc"), result.get("message"))
+    except BookingError as e:
+        db.log_booking_finish(log_id, "failed", message=str(e))
+    except Exception as e:
+        db.log_booking_finish(log_id, "error", message=str(e))
+        log.exception("Manual run of job %d error:", job.id)
 
 
 @router.post("/jobs/{job_id}/run", response_class=HTMLResponse)
-def job_run_now(request: Request, job_id: int, auth: Auth = Depends(require_account)):
+def job_run_now(request: Request, job_id: int, background: BackgroundTasks,
+                auth: Auth = Depends(require_account)):
     job = db.get_job(job_id, auth.account.id)
     if not job:
         return HTMLResponse('<div role="alert">Job not found</div>')
@@ -172,22 +238,23 @@ def job_run_now(request: Request, job_id: int, auth: Auth = Depends(require_acco
         manual=True,
     )
 
-    try:
-        result = execute_booking(
-            account=auth.account,
-            library_id=job.library_id,
-            date=target_date.strftime("%d.%m.%Y"),
-            time_slot=job.time_slot,
-            group_room=job.group_room,
-            preferred_section=job.preferred_section or "",
-        )
-        db.log_booking_finish(log_id, "success", result.get("seat_desc"), result.get("message"))
-        alert = f'<div role="alert" class="alert-success">Booked: {escape(result.get("seat_desc") or "OK")}</div>'
-    except BookingError as e:
-        db.log_booking_finish(log_id, "failed", message=str(e))
-        alert = f'<div role="alert" class="alert-error">Failed: {escape(str(e))}</div>'
-    except Exception as e:
-        db.log_booking_finish(log_id, "error", message=str(e))
-        alert = f'<div role="alert" class="alert-error">Error: {escape(str(e))}</div>'
-
+    # The booking itself takes seconds of network IO — run it after the
+    # response and let the alert poll the log row for the outcome.
+    background.add_task(_run_booking, auth.account, job, target_date, log_id)
+    return HTMLResponse(_pending_alert(log_id))
+
+
+@router.get("/jobs/runs/{log_id}", response_class=HTMLResponse)
+def job_run_status(request: Request, log_id: int, auth: Auth = Depends(require_account)):
+    """Polled by the pending alert until the background booking finishes."""
+    booking = db.get_booking(log_id, auth.account.id)
+    if not booking:
+        return HTMLResponse('<div role="alert">Run not found</div>')
+    if booking.status == "running":
+        return HTMLResponse(_pending_alert(log_id))
+    if booking.status == "success":
+        alert = f'<div role="alert" class="alert-success">Booked: {escape(booking.seat_desc or "OK")}</div>'
+    else:
+        label = "Failed" if booking.status == "failed" else "Error"
+        alert = f'<div role="alert" class="alert-error">{label}: {escape(booking.message or "")}</div>'
     return HTMLResponse(alert)